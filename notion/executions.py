@@ -4,6 +4,8 @@ from .default_imports import *  # pylint: disable=unused-wildcard-import
 
 # == BEGIN CUSTOM IMPORTS ==
 # Custom imports go here.
+from datetime import timezone
+
 # == END CUSTOM IMPORTS ==
 
 
@@ -97,5 +99,6 @@ class Execution(RecordBase):
             return task.date_created
         else:
             # If this is the first execution, return a timestamp far in the past so we'll
-            # get all tasks completed ever.
-            return datetime.fromtimestamp(0)
+            # get all tasks completed ever. Make it explicitly UTC, so it doesn't depend on
+            # the local timezone, which may not have been set yet.
+            return datetime.fromtimestamp(0, tz=timezone.utc)
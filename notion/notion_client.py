@@ -10,6 +10,28 @@ class NotionClient:
     def __init__(self, api_key: str):
         self.api_key = api_key
 
+    async def _query_db_page(
+        self, database_id: str, payload: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """Query one page of a database, returning Notion's full response (including the
+        pagination fields `has_more` and `next_cursor`)."""
+        # Set the database url
+        database_url = f"{NOTION_API_URL}/databases/{database_id}/query"
+
+        async with httpx.AsyncClient(timeout=60.0) as client:
+            # Query the database with the provided parameters, and check that the call succeeded
+            response = await client.post(
+                database_url,
+                headers={
+                    "Authorization": f"{self.api_key}",
+                    "Notion-Version": NOTION_API_VERSION,
+                },
+                json=payload,
+            )
+            response.raise_for_status()
+
+            return response.json()
+
     async def query_db(
         self,
         *,
@@ -21,9 +43,6 @@ class NotionClient:
         page_size: Optional[int] = None,
     ) -> List[Mapping[str, Any]]:
         """Query a database with the desired parameters."""
-        # Set the database url
-        database_url = f"{NOTION_API_URL}/databases/{database_id}/query"
-
         # Build the payload. In testing, Notion was able to handle the empty payload.
         payload: Dict[str, Any] = {}
         if filter is not None:
@@ -33,20 +52,32 @@ class NotionClient:
         if page_size is not None:
             payload["page_size"] = page_size
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Query the database with the provided parameters, and check that the call succeeded
-            response = await client.post(
-                database_url,
-                headers={
-                    "Authorization": f"{self.api_key}",
-                    "Notion-Version": NOTION_API_VERSION,
-                },
-                json={**payload, **params},
-            )
-            response.raise_for_status()
+        ret = await self._query_db_page(database_id, {**payload, **params})
+        return ret["results"]
+
+    async def query_db_all_pages(
+        self,
+        *,
+        database_id: str,
+        filter: Optional[Mapping[str, Any]] = None,
+        sorts: Optional[List[Mapping[str, str]]] = None,
+    ) -> List[Mapping[str, Any]]:
+        """Query a database, following Notion's pagination until we have every matching
+        result. `query_db` only returns the first page."""
+        # Build the payload, asking for the largest page Notion allows.
+        payload: Dict[str, Any] = {"page_size": 100}
+        if filter is not None:
+            payload["filter"] = filter
+        if sorts is not None:
+            payload["sorts"] = sorts
 
-            ret = response.json()
-            return ret["results"]
+        results: List[Mapping[str, Any]] = []
+        while True:
+            ret = await self._query_db_page(database_id, payload)
+            results.extend(ret["results"])
+            if not ret.get("has_more"):
+                return results
+            payload["start_cursor"] = ret["next_cursor"]
 
     async def retrieve_db(
         self,
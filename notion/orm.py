@@ -106,6 +106,19 @@ class RecordBase(metaclass=ABCMeta):
         result = await client.query_db(database_id=cls.database_id(), filter=filter)
         return cls.unpack_records(result)
 
+    @classmethod
+    async def find_all_pages_by(
+        cls: Type[T],
+        client: NotionClient,
+        filter: Optional[Mapping[str, Any]] = None,
+    ) -> List[T]:
+        """Look up records by arbitrary things, fetching every page of results rather
+        than just the first."""
+        result = await client.query_db_all_pages(
+            database_id=cls.database_id(), filter=filter
+        )
+        return cls.unpack_records(result)
+
     @classmethod
     async def find_by(
         cls: Type[T],
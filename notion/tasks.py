@@ -223,27 +223,23 @@ class Task(RecordBase):
 
     # == BEGIN CUSTOM CODE ==
     @classmethod
-    async def check_open_task_exists_by_name(
+    async def find_open_task_names(
         cls,
         client: NotionClient,
-        task_name: str,
-    ) -> bool:
-        """Check if any open (incomplete) tasks exist with this name."""
-        task = await cls.find_by(
+    ) -> Set[str]:
+        """Get the names of all open (incomplete) tasks. This fetches every page of
+        results, so callers can check names against the set rather than querying once
+        per name."""
+        tasks = await cls.find_all_pages_by(
             client,
             {
-                "and": [
-                    {"property": "Name", "text": {"equals": task_name}},
-                    {
-                        "property": "Done",
-                        "checkbox": {
-                            "does_not_equal": True,
-                        },
-                    },
-                ]
+                "property": "Done",
+                "checkbox": {
+                    "does_not_equal": True,
+                },
             },
         )
-        return task is not None
+        return {t.name for t in tasks}
 
     @classmethod
     async def find_completed_recurring_tasks_since(
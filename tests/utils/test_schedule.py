@@ -9,16 +9,21 @@ from dateutil.relativedelta import relativedelta
 from notion.orm import now_utc
 from notion.tasks import Task
 from utils.schedule import (
+    MONTHS,
+    WEEKDAYS,
     Interval,
     Schedule,
     StartFrom,
+    add_interval,
     get_next,
     get_next_due_date,
     handle_special_cases,
     parse_days,
     parse_frequency_and_interval,
     parse_numerics,
+    parse_schedule_str,
     parse_start_from,
+    parse_time,
     parse_weekdays,
 )
 
@@ -66,24 +71,34 @@ def test_start_from():
         parse_start_from("from GIBBERISH")
 
 
+def test_name_lookups():
+    """Day and month names map to their calendar numbers."""
+    assert WEEKDAYS["monday"] == WEEKDAYS["mon"] == 1
+    assert WEEKDAYS["sunday"] == WEEKDAYS["sun"] == 7
+    assert MONTHS["january"] == MONTHS["jan"] == 1
+    assert MONTHS["december"] == MONTHS["dec"] == 12
+    assert "" not in MONTHS
+
+
 def test_parse_numerics():
     """Unit test for `parse_numerics`."""
-    assert parse_numerics("3") == [3]
-    assert parse_numerics("3/1-2/7-8") == [1, 2, 3, 7, 8]
+    assert parse_numerics("3") == (3,)
+    assert parse_numerics("3/1-2/7-8") == (1, 2, 3, 7, 8)
 
 
 def test_parse_days():
     """Unit test for `parse_days`."""
-    assert parse_days("on the last day") == [-1]
-    assert parse_days("on day 3") == [3]
-    assert parse_days("on day 3/1-2/7-8") == [1, 2, 3, 7, 8]
+    assert parse_days("the last day") == (-1,)
+    assert parse_days("day 3") == (3,)
+    assert parse_days("day 3/1-2/7-8") == (1, 2, 3, 7, 8)
 
 
 def test_parse_weekdays():
     """Unit test for `parse_days`."""
-    assert parse_weekdays("on day 3") == [3]
-    assert parse_weekdays("on mon/tuesday") == [1, 2]
-    assert parse_weekdays("on MON-TUE/FRI-SAT") == [1, 2, 5, 6]
+    assert parse_weekdays("day 3") == (3,)
+    assert parse_weekdays("mon/tuesday") == (1, 2)
+    assert parse_weekdays("MON-TUE/FRI-SAT") == (1, 2, 5, 6)
+    assert parse_weekdays("mon /tue") == (1, 2)
 
     # Check that it throws an exception if we're asking for out of bounds days
     with pytest.raises(
@@ -92,26 +107,122 @@ def test_parse_weekdays():
             r"Failed to parse weekdays string 'day 8', error: Out of bounds numbers in list [8], min: 1, max: 7"
         ),
     ):
-        parse_weekdays("on day 8")
+        parse_weekdays("day 8")
+
+
+def test_parse_time():
+    """Unit test for `parse_time`."""
+    assert parse_time("9am") == time(hour=9)
+    assert parse_time("9:30 PM") == time(hour=21, minute=30)
+    assert parse_time("12am") == time(hour=0)
+    assert parse_time("12pm") == time(hour=12)
+    assert parse_time("17:30") == time(hour=17, minute=30)
+
+    # Check that it throws an exception for things that aren't times
+    with pytest.raises(
+        Exception,
+        match=r"Failed to parse time string 'noonish'",
+    ):
+        parse_time("noonish")
+    with pytest.raises(
+        Exception,
+        match=r"Failed to parse time string '25:00'",
+    ):
+        parse_time("25:00")
 
 
 def test_handle_special_cases():
     """Unit test `handle_special_cases`."""
-    assert handle_special_cases("Every day") == "Every 1 days"
-    assert handle_special_cases("Every day, at 9am") == "Every 1 days, at 9am"
-    assert handle_special_cases("Every weekday") == "Every 1 weeks, on 1-5"
+    assert handle_special_cases("Every day") == "every 1 days"
+    assert handle_special_cases("Every day, at 9am") == "every 1 days, at 9am"
+    assert handle_special_cases("Every weekday") == "every 1 weeks, on 1-5"
     assert (
-        handle_special_cases("Every weekday, at 9am") == "Every 1 weeks, on 1-5, at 9am"
+        handle_special_cases("Every weekday, at 9am") == "every 1 weeks, on 1-5, at 9am"
     )
     assert (
-        handle_special_cases("Every saturday/sun") == "Every 1 weeks, on saturday/sun"
+        handle_special_cases("Every saturday/sun") == "every 1 weeks, on saturday/sun"
     )
     assert (
         handle_special_cases("Every saturday/sun, at 9am")
-        == "Every 1 weeks, on saturday/sun, at 9am"
+        == "every 1 weeks, on saturday/sun, at 9am"
+    )
+
+    # Everything else is just lowercased
+    assert handle_special_cases("Every 1 weeks") == "every 1 weeks"
+    assert (
+        handle_special_cases("Every 1 Weeks, From Due Date")
+        == "every 1 weeks, from due date"
+    )
+
+
+def test_parse_schedule_str():
+    """Unit test for `parse_schedule_str`."""
+    assert parse_schedule_str("Every day, at 7am") == (
+        Interval.DAYS,
+        1,
+        None,
+        time(hour=7, minute=0),
+        None,
     )
+    assert parse_schedule_str("Every 3 weeks, from due date") == (
+        Interval.WEEKS,
+        3,
+        None,
+        None,
+        StartFrom.DUE_DATE,
+    )
+    assert parse_schedule_str("Every 1 months, on day 1/5-6") == (
+        Interval.MONTHS,
+        1,
+        (1, 5, 6),
+        None,
+        None,
+    )
+
+    # Fields are also available by name
+    parsed = parse_schedule_str("Every 2 weeks, on mon/wed, at 9:30pm")
+    assert parsed.interval == Interval.WEEKS
+    assert parsed.frequency == 2
+    assert parsed.days == (1, 3)
+    assert parsed.at_time == time(hour=21, minute=30)
+    assert parsed.start_from is None
+
+    # Parsing only depends on the string, so repeated schedules are shared
+    assert parse_schedule_str("Every 1 months, on day 1/5-6") is parse_schedule_str(
+        "Every 1 months, on day 1/5-6"
+    )
+
+
+def test_add_interval():
+    """Unit test for `add_interval`."""
+    d = datetime(2021, 11, 15, 9, 30).astimezone()
+    assert add_interval(d, Interval.DAYS, 3) == d + relativedelta(days=3)
+    assert add_interval(d, Interval.WEEKS, 2) == d + relativedelta(weeks=2)
+    assert add_interval(d, Interval.MONTHS, 3) == d.replace(year=2022, month=2)
+    assert add_interval(d, Interval.YEARS, 2) == d.replace(year=2023)
 
-    assert handle_special_cases("Every 1 weeks") == "Every 1 weeks"
+    # Days that don't exist in every month are clamped to the end of the month
+    d = datetime(2024, 1, 31).astimezone()
+    assert add_interval(d, Interval.MONTHS, 1) == d.replace(month=2, day=29)
+    d = datetime(2024, 2, 29).astimezone()
+    assert add_interval(d, Interval.YEARS, 1) == d.replace(year=2025, day=28)
+
+
+def test_get_next_as_of():
+    """Test that the next due date can be computed as of a given time."""
+    now = datetime(2021, 3, 10, 12, 0).astimezone()
+    base = datetime(2021, 3, 7, 9, 30).astimezone()
+    d = get_next(base, Interval.DAYS, 2, time(hour=9, minute=30), now=now)
+    assert d == datetime(2021, 3, 11, 9, 30).astimezone()
+
+    task = Task(
+        date_created=now_utc(),
+        last_edited_time=now_utc(),
+        name="Test",
+        schedule="0 8 * * *",
+        due_date=base,
+    )
+    assert get_next_due_date(task, now) == datetime(2021, 3, 11, 8, 0).astimezone()
 
 
 def test_get_next_interval_days_no_days():
@@ -395,7 +506,7 @@ def test_schedule_parses_task():
     schedule = Schedule(task)
     assert schedule._at_time is None
     assert schedule._base == task.due_date
-    assert schedule._days == [1, 2, 3, 5]
+    assert schedule._days == (1, 2, 3, 5)
     assert schedule._interval == Interval.WEEKS
     assert schedule._frequency == 3
 
@@ -0,0 +1,108 @@
+"""Test the serde utility."""
+
+from typing import Any, Dict, List, Optional, Union
+from uuid import UUID, uuid4
+
+import pytest
+
+from notion.orm import SelectOptions
+from utils.serde import Deserializable, Serializable
+
+
+class Child(Deserializable, Serializable):
+    id: UUID
+    options: List[SelectOptions]
+    extra: Optional[Dict[str, Any]]
+
+    def __init__(
+        self,
+        *,
+        id: UUID,
+        options: List[SelectOptions],
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.id = id
+        self.options = options
+        self.extra = extra
+
+
+def test_round_trip():
+    id = uuid4()
+    json = {
+        "id": str(id),
+        "options": [{"id": "a", "name": "High", "color": "red"}],
+        "extra": None,
+    }
+    child = Child.from_json(json)
+    assert child.id == id
+    assert child.options[0].name == "High"
+    assert child.extra is None
+    assert child.to_json() == json
+
+    # We shouldn't modify the caller's dict.
+    assert json["id"] == str(id)
+
+
+def test_from_json_errors():
+    with pytest.raises(Exception, match="expected dict"):
+        SelectOptions.from_json([])
+    with pytest.raises(Exception, match="bogus not declared"):
+        SelectOptions.from_json({"bogus": 1})
+    with pytest.raises(Exception, match="bar, bogus not declared"):
+        SelectOptions.from_json({"name": "High", "bogus": 1, "bar": 2})
+
+
+class Grandchild(Child):
+    parent: Optional["Child"]
+
+    def __init__(self, *, parent: Optional["Child"] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.parent = parent
+
+
+def test_inherited_annotations():
+    json = {"id": str(uuid4()), "options": [], "extra": {"a": 1}}
+    grandchild = Grandchild.from_json({**json, "parent": json})
+    assert isinstance(grandchild.parent, Child)
+    assert grandchild.parent.extra == {"a": 1}
+    assert grandchild.to_json()["parent"] == json
+
+
+class Unsupported(Deserializable, Serializable):
+    name: str
+    extra: Optional[Dict[int, int]]
+    either: Optional[Union[int, str]]
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        extra: Optional[Dict[int, int]] = None,
+        either: Optional[Union[int, str]] = None,
+    ):
+        self.name = name
+        self.extra = extra
+        self.either = either
+
+
+def test_unsupported_type_only_raises_for_values():
+    # A field we can't convert is fine as long as it's missing or `None`.
+    assert Unsupported.from_json({"name": "x"}).to_json() == {
+        "name": "x",
+        "extra": None,
+        "either": None,
+    }
+    assert Unsupported.from_json({"name": "x", "extra": None}).extra is None
+    assert Unsupported.from_json({"name": "x", "either": None}).either is None
+
+    with pytest.raises(Exception, match="Can't deserialize dict type"):
+        Unsupported.from_json({"name": "x", "extra": {1: 2}})
+    with pytest.raises(Exception, match="Unknown dict args"):
+        Unsupported(name="x", extra={1: 2}).to_json()
+
+    # Non-class annotations (here a `Union` that isn't just `Optional`) aren't silently
+    # passed through either.
+    with pytest.raises(Exception, match="Can't deserialize type: typing.Union"):
+        Unsupported.from_json({"name": "x", "either": 1})
+    with pytest.raises(Exception, match="Can't serialize type: typing.Union"):
+        Unsupported(name="x", either=1).to_json()
@@ -3,12 +3,23 @@
 
 import calendar
 import re
-from datetime import date, datetime, time
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta
 from enum import Enum
-from typing import List, Optional, Tuple, Union
-
-from croniter import croniter
-from dateutil import parser
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Callable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from croniter import CroniterError, croniter
 from dateutil.relativedelta import relativedelta
 from loguru import logger
 
@@ -31,18 +42,94 @@ class Interval(Enum):
     YEARS = 4
 
 
-WEEKDAYS = {
-    **{d.lower(): i for i, d in enumerate(calendar.day_name, start=1)},
-    **{d.lower(): i for i, d in enumerate(calendar.day_abbr, start=1)},
+# Lookups from the words used in schedule strings to their enum values
+_INTERVALS = {
+    "days": Interval.DAYS,
+    "weeks": Interval.WEEKS,
+    "months": Interval.MONTHS,
+    "years": Interval.YEARS,
+}
+
+_START_FROMS = {
+    "due date": StartFrom.DUE_DATE,
+    "completed date": StartFrom.COMPLETED_DATE,
 }
 
-MONTHS = {
-    **{m.lower(): i for i, m in enumerate(calendar.month_name, start=1)},
-    **{m.lower(): i for i, m in enumerate(calendar.month_abbr, start=1)},
+# How to build an offset of `n` of each interval. Days and weeks are a fixed length, so a
+# plain `timedelta` is enough and much cheaper to add; months and years need calendar-aware
+# arithmetic.
+_INTERVAL_DELTAS: Mapping[
+    Interval, Callable[[int], Union[timedelta, relativedelta]]
+] = {
+    Interval.DAYS: lambda n: timedelta(days=n),
+    Interval.WEEKS: lambda n: timedelta(weeks=n),
+    Interval.MONTHS: lambda n: relativedelta(months=n),
+    Interval.YEARS: lambda n: relativedelta(years=n),
 }
 
+# Full and abbreviated names, e.g. "monday" and "mon", mapped to their number. These are
+# read-only so they can safely be shared by cached parse results.
+WEEKDAYS: Mapping[str, int] = MappingProxyType(
+    {
+        name.lower(): i
+        for i, names in enumerate(zip(calendar.day_name, calendar.day_abbr), start=1)
+        for name in names
+    }
+)
+
+# Month names are already indexed from 1; index 0 is an empty placeholder, so skip it.
+MONTHS: Mapping[str, int] = MappingProxyType(
+    {
+        name.lower(): i
+        for i, names in enumerate(zip(calendar.month_name, calendar.month_abbr))
+        for name in names
+        if name
+    }
+)
+
+# Every weekday name starts with its abbreviation, so the first three characters are
+# enough to identify a day.
+_WEEKDAY_BY_PREFIX = {name[:3]: i for name, i in WEEKDAYS.items()}
+
+# Matches any weekday name. There is some subtle but _VERY IMPORTANT_ behavior here. Most
+# day abbreviations are subsets of the full day (e.g. "tue", "tuesday"). We sort the list of
+# day names by length in reverse order to make sure that full day names are _matched
+# first_. If we don't do this, a string like "monday/tuesday" may be turned into
+# "1day/2day".
+WEEKDAY_PATTERN = re.compile(
+    "|".join(sorted((re.escape(k) for k in WEEKDAYS), key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+# The number for each weekday name, already as a string, to substitute for it when parsing
+# weekdays (re.sub expects the replacement function to return a string)
+_WEEKDAY_NUMBERS = {name: str(i) for name, i in WEEKDAYS.items()}
+
+# Times look like "9am", "9:30 pm", or "17:30"
+TIME_PATTERN = re.compile(r"\s*(\d{1,2})(?::(\d{2}))?\s*([ap]m)?\s*", re.IGNORECASE)
+
+
+class ParsedSchedule(NamedTuple):
+    """The parts of a schedule string that don't depend on a particular task."""
+
+    # The interval, and how many of them elapse between events
+    interval: Interval
+    frequency: int
+
+    # Specific days of the week/month/year, as numbers (last is represented as -1)
+    days: Optional[Tuple[int, ...]]
+
+    # Time that it's due, without a timezone
+    at_time: Optional[time]
+
+    # Whether to start from the due date or completed date
+    start_from: Optional[StartFrom]
+
 
 class Schedule:
+    # Schedules are created for every recurring task, so skip the per-instance `__dict__`
+    __slots__ = ("_interval", "_frequency", "_base", "_at_time", "_days")
+
     # The interval (can be one of "days", "weeks", "months", "years")
     _interval: Interval
 
@@ -56,7 +143,7 @@ class Schedule:
     _at_time: Optional[time]
 
     # Specific days of the week/month/year, as numbers (last is represented as -1)
-    _days: Optional[List[int]]
+    _days: Optional[Tuple[int, ...]]
 
     @property
     def interval(self) -> Interval:
@@ -75,7 +162,7 @@ class Schedule:
         return self._at_time
 
     @property
-    def days(self) -> Optional[List[int]]:
+    def days(self) -> Optional[Tuple[int, ...]]:
         return self._days
 
     def __init__(self, task: Task):
@@ -85,67 +172,21 @@ class Schedule:
         if task.schedule is None:
             raise Exception(f"Task '{task.name}' has no schedule.")
 
-        # Make sure that days and at_time are initialized
-        self._days = None
-        self._at_time = None
-
-        # Handle some special cases...
-        schedule = handle_special_cases(task.schedule)
-        logger.info(
-            f"Schedule '{task.schedule}' converted to '{schedule}' after special cases."
-        )
+        # Parsing only depends on the schedule string, so that part is cached and shared
+        # between tasks. Everything below it depends on the task itself.
+        try:
+            parsed = parse_schedule_str(task.schedule)
+        except Exception as e:
+            raise Exception(f"Cannot process task '{task.name}' - {e}")
+        self._interval = parsed.interval
+        self._frequency = parsed.frequency
+        self._at_time = parsed.at_time
 
-        # Handle the simple case of "Every (X) (interval)". Components are separated by
-        # commas to make processing easier. Then, each piece is separated by a space.
-        components = [s.strip() for s in schedule.split(",")]
-        logger.info(f"Schedule has {len(components)} components: {components}.")
-
-        # We should always have a frequency and interval component, e.g.
-        # "Every (frequency) (interval)"
-        interval, frequency = parse_frequency_and_interval(components[0])
-        self._interval = interval
-        self._frequency = frequency
-        logger.info(
-            f"Schedule for task {task.name} has interval {interval.name}, frequency {frequency}."
-        )
-
-        # If there is more to parse, we expect to have _either_ a specification of starting
-        # from due date/completed date, _or_ specific days this should be on, and maybe
-        # a desired time it's due.
-        start_from: Optional[StartFrom] = None
-        for c in components[1:]:
-            # Check if it's of the form "from due date/start"
-            if c.startswith("from"):
-                start_from = parse_start_from(c)
-            elif c.startswith("on"):
-                # Parse this as a specific set of days.
-                if self._interval == Interval.DAYS:
-                    # "Every 3 days, on Tuesday" doesn't make sense
-                    raise Exception(
-                        f"Cannot process task '{task.name}' - schedules with intervals of 'days' cannot execute on specific days"
-                    )
-                elif self._interval == Interval.WEEKS:
-                    # Parse weekdays is a bit more general; it handles parsing day strings as well
-                    self._days = parse_weekdays(c)
-                else:
-                    # Otherwise, we expect this to be a set of numeric days of the week/month/year
-                    self._days = parse_days(c)
-            elif c.startswith("at"):
-                today_at_desired_time = parser.parse(c[3:])
-                self._at_time = time(
-                    hour=today_at_desired_time.hour,
-                    minute=today_at_desired_time.minute,
-                )
-
-        # Now, check some of our configuration and make sure the base is set appropriately.
-        # We set the base depending on `start_from`.
-        if self._days and start_from:
-            raise Exception(
-                f"Can't set both 'days' and whether to start from due date/completed date."
-            )
+        # The cached days are a tuple, so they're safe to share between schedules
+        self._days = parsed.days
 
         # Get the base, and make sure we sync the timezones on "at_time" and "base"
-        self._base = get_base(task, start_from, self._days)
+        self._base = get_base(task, parsed.start_from, self._days)
         if self._at_time is not None:
             self._at_time = self._at_time.replace(tzinfo=self._base.tzinfo)
 
@@ -153,14 +194,16 @@ class Schedule:
             f"Schedule for task {task.name} has base {self._base}, at_time {self._at_time}"
         )
 
-    def get_next(self):
-        """Get the next due date for this schedule."""
+    def get_next(self, now: Optional[datetime] = None) -> Union[datetime, date]:
+        """Get the next due date for this schedule, as of `now` (defaults to the current
+        time)."""
         return get_next(
             self._base,
             self._interval,
             self._frequency,
             self._at_time,
             self._days,
+            now,
         )
 
 
@@ -169,92 +212,84 @@ def get_next(
     interval: Interval,
     frequency: int,
     at_time: Optional[time] = None,
-    days: Optional[list[int]] = None,
+    days: Optional[Sequence[int]] = None,
+    now: Optional[datetime] = None,
 ) -> Union[datetime, date]:
-    """Get the next due date, starting from the given base."""
+    """Get the next due date, starting from the given base. `now` should be in the local
+    timezone; callers working through many schedules can pass it in to only look up the
+    current time once."""
+    # Log with arguments rather than f-strings here, so the messages are only formatted if
+    # something is listening; this runs once for every recurring task.
     logger.info(
-        f"Getting next due date with base {base}, interval {interval.name}, frequency {frequency}, at_time {at_time}, and days {days}"
+        "Getting next due date with base {}, interval {}, frequency {}, at_time {}, and days {}",
+        base,
+        interval.name,
+        frequency,
+        at_time,
+        days,
     )
 
-    # If we don't have a time we expect this to be at, simply use all zeroes
-    due_time = time()
+    # If we don't have a time we expect this to be at, simply use all zeroes. Only the
+    # hour and minute are ever used, so pull them out once up front.
+    at_hour, at_minute = 0, 0
     if at_time is not None:
-        due_time = at_time
+        at_hour, at_minute = at_time.hour, at_time.minute
 
     # Standardize on the current timezone, to account for crossing boundaries (e.g. daylight
     # savings time) if we're comparing dates across boundaries. Also, if we don't have "at_time",
     # then we effectively ignore the time component by zeroing it out in `now` as well. Below,
     # we compare the next due date to now, and we only care about the time component if we have
-    # a specific time.
-    now = datetime.now().astimezone()
+    # a specific time. The local timezone is looked up here rather than cached at import,
+    # since the worker sets `TZ` at runtime.
+    if now is None:
+        now = datetime.now().astimezone()
     if at_time is None:
-        now = now.replace(
-            hour=due_time.hour, minute=due_time.minute, second=0, microsecond=0
-        )
+        now = now.replace(hour=at_hour, minute=at_minute, second=0, microsecond=0)
     base = base.replace(tzinfo=now.tzinfo)
-    next_due_date = base.replace(tzinfo=now.tzinfo)
-
-    logger.info(f"Base in local timezone: {next_due_date}")
-
-    # How many days, weeks, months, years have elapsed since the base?
-    # Days, months, and years are pretty simple
-    years_elapsed = now.year - base.year
-    months_elapsed = (years_elapsed * 12) + (now.month - base.month)
-    days_elapsed = (now - base).days
-
-    # Weeks are a little more complex, because we want "week boundaries crossed" (e.g.
-    # Sunday -> Monday is 1 week elapsed, but only one day). To do that, we compare
-    # Monday of the week we're in, to Monday of the week the base is in, and divide
-    # by the number of days in a week. We use the floor operator (`//`). We also make
-    # sure to zero out the time component when comparing, to get an accurate picture
-    # of days elapsed.
-    weeks_elapsed = (
-        (now - relativedelta(days=now.weekday()))
-        - (
-            base.replace(
-                hour=0,
-                minute=0,
-                second=0,
-                microsecond=0,
-            )
-            - relativedelta(days=base.weekday())
-        )
-    ).days // 7
-
-    # Calculate elapsed times and how many days/weeks/months/years we would add, based
-    # on frequency, for all possible intervals. This is very cheap, and means we can
-    # handle cases generically below. To figure out how many (X) to add, we figure out
-    # how many periods we've missed (divide by frequency).
-    elapsed_times = {
-        "days": days_elapsed,
-        "weeks": weeks_elapsed,
-        "months": months_elapsed,
-        "years": years_elapsed,
-    }
-    to_add = {k: max((v // frequency) * frequency, 0) for k, v in elapsed_times.items()}
+    next_due_date = base
+
+    logger.info("Base in local timezone: {}", next_due_date)
+
+    # How many days, weeks, months, or years have elapsed since the base? We only need
+    # the one for our interval. Days, months, and years are pretty simple.
+    base_weekday = base.weekday()
+    if interval == Interval.DAYS:
+        elapsed = (now - base).days
+    elif interval == Interval.WEEKS:
+        # Weeks are a little more complex, because we want "week boundaries crossed" (e.g.
+        # Sunday -> Monday is 1 week elapsed, but only one day). To do that, we compare
+        # Monday of the week we're in, to Monday of the week the base is in, and divide
+        # by the number of days in a week. We use the floor operator (`//`). Comparing
+        # day ordinals ignores the time component, to get an accurate picture of days
+        # elapsed.
+        elapsed = (
+            (now.toordinal() - now.weekday()) - (base.toordinal() - base_weekday)
+        ) // 7
+    elif interval == Interval.MONTHS:
+        elapsed = (now.year - base.year) * 12 + (now.month - base.month)
+    else:
+        elapsed = now.year - base.year
 
-    logger.info(f"Elapsed time since base: {elapsed_times}")
-    logger.info(f"Times to add: {to_add}")
+    # Figure out how many (X) to add, based on frequency. We figure out how many periods
+    # we've missed (divide by frequency).
+    periods_to_add = max((elapsed // frequency) * frequency, 0)
+
+    logger.info("Elapsed {} since base: {}", interval.name, elapsed)
+    logger.info("{} to add: {}", interval.name, periods_to_add)
 
     if not days:
-        logger.info(f"No days - adding intervals.")
-        next_due_date = next_due_date + relativedelta(
-            **{
-                interval.name.lower(): to_add[interval.name.lower()] + frequency
-            }  # type: ignore
+        logger.info("No days - adding intervals.")
+        next_due_date = add_interval(
+            next_due_date, interval, periods_to_add + frequency
         )
     else:
         # Otherwise, we have specific days that this is supposed to execute
         # on.
-        logger.info(f"Have specific days {days} this should execute on.")
+        logger.info("Have specific days {} this should execute on.", days)
 
         # If we have particular days, first figure out when the _latest_ it
         # will be due is. This is the base + intervals to add + frequency + offset
-        latest_due = base + relativedelta(
-            **{
-                interval.name.lower(): to_add[interval.name.lower()] + frequency
-            }  # type: ignore
-        )
+        latest_due = add_interval(base, interval, periods_to_add + frequency)
 
         # Also factor in the first day this may execute on. Offset is the first day - 1
         # if that's non negative, or the last day of the month. For example, if days is
@@ -265,106 +300,84 @@ def get_next(
         offset = (
             days[0] - 1
             if days[0] != -1
-            else calendar.monthrange(latest_due.year, latest_due.month)[-1]
+            else last_day_of_month(latest_due.year, latest_due.month)
         )
-        latest_due = latest_due + relativedelta(days=offset)
+        latest_due = latest_due + timedelta(days=offset)
         logger.info(
-            f"With base {base}, delta {interval.name.lower()}: {to_add[interval.name.lower()] + frequency}, offset {offset}, the latest possible due date is: {latest_due}"
+            "With base {}, delta {}: {}, offset {}, the latest possible due date is: {}",
+            base,
+            interval.name,
+            periods_to_add + frequency,
+            offset,
+            latest_due,
         )
 
         if interval == Interval.WEEKS:
             # Next, figure out which week we're comparing against. This is Monday of either
             # this week, or the last week this schedule would have executed.
-            due_base_local = (
-                base.replace(hour=due_time.hour, minute=due_time.minute, second=0)
-                - relativedelta(days=base.weekday())
-                + relativedelta(weeks=to_add[interval.name.lower()])
-            )
+            # Weeks are a fixed number of days, so this is a single day offset.
+            due_base_local = base.replace(
+                hour=at_hour, minute=at_minute, second=0
+            ) + timedelta(days=7 * periods_to_add - base_weekday)
         elif interval == Interval.MONTHS:
             # Figure out which month we're comparing against. This is the first day
             # of this month, or the last month this schedule may have executed in.
-            due_base_local = base.replace(
-                hour=due_time.hour, minute=due_time.minute, second=0, day=1
-            ) + relativedelta(
-                **{interval.name.lower(): to_add[interval.name.lower()]}  # type: ignore
+            due_base_local = add_interval(
+                base.replace(hour=at_hour, minute=at_minute, second=0, day=1),
+                interval,
+                periods_to_add,
             )
         elif interval == Interval.YEARS:
             # Figure out which year we're comparing against. This is the first day
             # of this year, or the last year this schedule may have executed in.
-            due_base_local = base.replace(
-                hour=due_time.hour,
-                minute=due_time.minute,
-                second=0,
-                day=1,
-                month=1,
-            ) + relativedelta(
-                **{interval.name.lower(): to_add[interval.name.lower()]}  # type: ignore
+            due_base_local = add_interval(
+                base.replace(hour=at_hour, minute=at_minute, second=0, day=1, month=1),
+                interval,
+                periods_to_add,
             )
         else:
             # We shouldn't be able to get here, but let's be extra safe.
             raise Exception(
                 f"Can't get next due date with days {days}, base {base}, and interval {interval.name} - unknown interval"
             )
-        logger.info(f"Due base local with interval {interval.name}: {due_base_local}")
+        logger.info(
+            "Due base local with interval {}: {}", interval.name, due_base_local
+        )
 
         # Now that we have a base to work from, we can figure out when this would next
-        # be due on one of the days we're interested in.
-        for d in days:
-            # Then, for each of the days we're interested in, figure out when it would
-            # be due next, on that day (either this interval, or `frequency` intervals
-            # in the future)
-            if d == -1:
-                # If we're looking for the last day of the month, find the last day and
-                # replace `due_base_local.day`
-                next_due_on_day = due_base_local.replace(
-                    day=calendar.monthrange(due_base_local.year, due_base_local.month)[
-                        -1
-                    ]
-                )
-            else:
-                # We always subtract one because "day n" is an offset of n-1, etc. (since
-                # we're starting on day 1)
-                next_due_on_day = due_base_local + relativedelta(days=d - 1)
-
-            logger.info(f"Next due on day {d}: {next_due_on_day}. Now: {now}")
-            # If the next due date on this day is before now, or the next due date on this day is less
-            # than or equal to our starting base, we want to keep iterating into the future.
-            if next_due_on_day <= base or next_due_on_day < now:
-                if d == -1:
-                    # If we're looking for the last day of the month, set that for the
-                    # next month. We do that by incrementing to the next month (in case
-                    # it's on a year boundary, we don't have to bother with that), and
-                    # replacing day with the last day of the month again
-                    next_due_on_day = next_due_on_day + relativedelta(days=1)
-                    next_due_on_day = next_due_on_day.replace(
-                        day=calendar.monthrange(
-                            next_due_on_day.year, next_due_on_day.month
-                        )[-1]
-                    )
-                else:
-                    # Otherwise, it's just incrementing days
-                    next_due_on_day = next_due_on_day + relativedelta(
-                        **{interval.name.lower(): frequency}  # type: ignore
-                    )
-
-            logger.info(
-                f"For day {d}, interval {interval.name}, next due on this day: {next_due_on_day}"
+        # be due on one of the days we're interested in. The next due date is the
+        # earliest of those, or the latest possible due date if that's sooner.
+        if interval == Interval.WEEKS:
+            # Days are sorted, and so are the dates they fall on in the week we're
+            # comparing against, so the days that haven't passed yet come last. Bisect for
+            # the first of those. If there isn't one, the first day is next, one period on.
+            i = bisect_left(
+                days,
+                True,
+                key=lambda d: not is_past_due(
+                    due_base_local + timedelta(days=d - 1), base, now
+                ),
+            )
+            next_day = days[i] if i < len(days) else days[0]
+            next_due_date = min(
+                latest_due,
+                next_due_on_day(
+                    next_day, due_base_local, base, now, interval, frequency
+                ),
+            )
+        else:
+            next_due_date = min(
+                latest_due,
+                *(
+                    next_due_on_day(d, due_base_local, base, now, interval, frequency)
+                    for d in days
+                ),
             )
-
-            # Finally, if the next date it's due on this day is less than the latest
-            # due date seen so far, set this as the latest due date.
-            if next_due_on_day < latest_due:
-                logger.info(
-                    f"Replacing latest due {latest_due} with next due on this day: {next_due_on_day}"
-                )
-                latest_due = next_due_on_day
-
-        next_due_date = latest_due
 
     # This is probably already done, but just be safe here.
     if at_time is not None:
         ret: Union[datetime, date] = next_due_date.replace(
-            hour=at_time.hour, minute=at_time.minute, second=0, microsecond=0
+            hour=at_hour, minute=at_minute, second=0, microsecond=0
         )
     else:
         ret = date(
@@ -373,15 +386,92 @@ def get_next(
             day=next_due_date.day,
         )
     logger.info(
-        f"Next due date with base {base}, interval {interval.name}, frequency {frequency}, at_time {at_time}, and days {days}: {next_due_date}"
+        "Next due date with base {}, interval {}, frequency {}, at_time {}, and days {}: {}",
+        base,
+        interval.name,
+        frequency,
+        at_time,
+        days,
+        next_due_date,
     )
     return ret
 
 
+def interval_delta(interval: Interval, n: int) -> Union[timedelta, relativedelta]:
+    """Get the offset for `n` of the given interval."""
+    return _INTERVAL_DELTAS[interval](n)
+
+
+def add_interval(dt: datetime, interval: Interval, n: int) -> datetime:
+    """Move `dt` forward by `n` of the given interval. Any day up to the 28th exists in
+    every month, so for months and years we can usually just replace the month and year,
+    which is much cheaper than `relativedelta`. Later days need it to clamp to the end of
+    shorter months."""
+    if interval in (Interval.MONTHS, Interval.YEARS) and dt.day <= 28:
+        months = dt.month - 1 + (n if interval == Interval.MONTHS else 12 * n)
+        return dt.replace(year=dt.year + months // 12, month=months % 12 + 1)
+    return dt + interval_delta(interval, n)
+
+
+@lru_cache(maxsize=128)
+def last_day_of_month(year: int, month: int) -> int:
+    """Get the last day of the given month. Schedules only ever look at a few months, so
+    these are cached."""
+    return calendar.monthrange(year, month)[-1]
+
+
+def is_past_due(next_due: datetime, base: datetime, now: datetime) -> bool:
+    """A due date is in the past if it's before now, or less than or equal to our
+    starting base."""
+    return next_due <= base or next_due < now
+
+
+def next_due_on_day(
+    day: int,
+    due_base_local: datetime,
+    base: datetime,
+    now: datetime,
+    interval: Interval,
+    frequency: int,
+) -> datetime:
+    """Figure out when a schedule would next be due on a specific day (either this
+    interval, or one period in the future), counting from `due_base_local`, the start of
+    the interval we're comparing against."""
+    if day == -1:
+        # If we're looking for the last day of the month, find the last day and
+        # replace `due_base_local.day`
+        next_due = due_base_local.replace(
+            day=last_day_of_month(due_base_local.year, due_base_local.month)
+        )
+    else:
+        # We always subtract one because "day n" is an offset of n-1, etc. (since
+        # we're starting on day 1)
+        next_due = due_base_local + timedelta(days=day - 1)
+
+    logger.debug("Next due on day {}: {}. Now: {}", day, next_due, now)
+    # If it's already past due, we want to keep iterating into the future.
+    if is_past_due(next_due, base, now):
+        if day == -1:
+            # If we're looking for the last day of the month, set that for the
+            # next month. We do that by incrementing to the next month (in case
+            # it's on a year boundary, we don't have to bother with that), and
+            # replacing day with the last day of the month again
+            next_due = next_due + timedelta(days=1)
+            next_due = next_due.replace(
+                day=last_day_of_month(next_due.year, next_due.month)
+            )
+        else:
+            # Otherwise, it's just incrementing days
+            next_due = add_interval(next_due, interval, frequency)
+
+    logger.debug("For day {}, next due on this day: {}", day, next_due)
+    return next_due
+
+
 def get_base(
     task: Task,
     start_from: Optional[StartFrom] = None,
-    days: Optional[List[int]] = None,
+    days: Optional[Sequence[int]] = None,
 ) -> datetime:
     """Get the base, given a task and an optional specification of when to start
     from."""
@@ -423,69 +513,140 @@ def get_base(
     # downstream. Internally, we operate on datetimes, but we allow either datetimes or
     # dates as input, and output either a datetime or date.
     if not isinstance(base, datetime):
-        base = datetime.combine(base, time()).astimezone()
+        base = datetime.combine(base, time())
 
     return base.astimezone()
 
 
+@lru_cache(maxsize=512)
+def parse_schedule_str(to_parse: str) -> ParsedSchedule:
+    """Parse a schedule string into its interval, frequency, days, time, and where to start
+    from. This only depends on the string, so results are cached; many tasks tend to share
+    the same schedule."""
+    # Handle some special cases...
+    schedule = handle_special_cases(to_parse)
+    logger.info(f"Schedule '{to_parse}' converted to '{schedule}' after special cases.")
+
+    # Handle the simple case of "Every (X) (interval)". Components are separated by
+    # commas to make processing easier. Then, each piece is separated by a space.
+    components = [s.strip() for s in schedule.split(",")]
+    logger.info(f"Schedule has {len(components)} components: {components}.")
+
+    # We should always have a frequency and interval component, e.g.
+    # "Every (frequency) (interval)"
+    interval, frequency = parse_frequency_and_interval(components[0])
+    logger.info(
+        f"Schedule '{to_parse}' has interval {interval.name}, frequency {frequency}."
+    )
+
+    # If there is more to parse, we expect to have _either_ a specification of starting
+    # from due date/completed date, _or_ specific days this should be on, and maybe
+    # a desired time it's due.
+    days: Optional[Tuple[int, ...]] = None
+    at_time: Optional[time] = None
+    start_from: Optional[StartFrom] = None
+    for c in components[1:]:
+        # Each component is keyed by its first word, e.g. "from", "on", or "at"
+        keyword, _, rest = c.partition(" ")
+
+        # Check if it's of the form "from due date/start"
+        if keyword == "from":
+            start_from = parse_start_from(c)
+        elif keyword == "on":
+            # Parse this as a specific set of days.
+            if interval == Interval.DAYS:
+                # "Every 3 days, on Tuesday" doesn't make sense
+                raise Exception(
+                    f"schedules with intervals of 'days' cannot execute on specific days"
+                )
+            elif interval == Interval.WEEKS:
+                # Parse weekdays is a bit more general; it handles parsing day strings as well
+                days = parse_weekdays(rest)
+            else:
+                # Otherwise, we expect this to be a set of numeric days of the week/month/year
+                days = parse_days(rest)
+        elif keyword == "at":
+            at_time = parse_time(rest)
+
+    # Now, check some of our configuration and make sure the base will be set appropriately.
+    # We set the base depending on `start_from`.
+    if days and start_from:
+        raise Exception(
+            f"Can't set both 'days' and whether to start from due date/completed date."
+        )
+
+    return ParsedSchedule(
+        interval=interval,
+        frequency=frequency,
+        days=days,
+        at_time=at_time,
+        start_from=start_from,
+    )
+
+
 def handle_special_cases(to_parse: str) -> str:
     """Handle special case strings. We just convert them to known format
     so our generic parsers can handle them:
         - Every (day/weekday) (at 9am)
-        - Every (Mon/Tue/Weds...) (at 9am)"""
+        - Every (Mon/Tue/Weds...) (at 9am)
+
+    The result is always lowercase, whether or not it was a special case."""
     s = to_parse.lower()
     if s.startswith("every day"):
-        return s.replace("every day", "Every 1 days")
+        return s.replace("every day", "every 1 days")
     elif s.startswith("every weekday"):
-        return s.replace("every weekday", "Every 1 weeks, on 1-5")
-    elif any([s.startswith(f"every {k}") for k in WEEKDAYS]):
-        # Otherwise, if it's every Mon/Tue/Weds, handle that...
+        return s.replace("every weekday", "every 1 weeks, on 1-5")
+    elif s.startswith("every ") and s[6:9] in _WEEKDAY_BY_PREFIX:
+        # Otherwise, if it's every Mon/Tue/Weds, handle that. Every day name starts with
+        # its abbreviation, so checking the first three letters is enough.
         parts = s.split(",")
-        return s.replace(parts[0], f"Every 1 weeks, on {parts[0][6:]}")
+        return s.replace(parts[0], f"every 1 weeks, on {parts[0][6:]}")
 
-    return to_parse
+    return s
 
 
+@lru_cache(maxsize=256)
 def parse_frequency_and_interval(to_parse: str) -> Tuple[Interval, int]:
     """Parse a string with frequency and interval."""
-    parts = to_parse.split(" ")
+    # Only the first three words matter, so don't split any further than that
+    parts = to_parse.split(" ", 3)
     try:
         # We can ignore the "Every" - skip straight to frequency
         frequency = int(parts[1])
-
-        # Then, parse the interval as an enum
-        interval = Interval[parts[2].upper()]
-
-        return interval, frequency
-    except KeyError:
-        raise Exception(f"No known interval {parts[2]}")
+        interval_name = parts[2]
     except Exception as e:
         raise Exception(
             f"Failed to parse frequency and interval string '{to_parse}', error: {e}"
         )
 
+    # Then, parse the interval as an enum
+    interval = _INTERVALS.get(interval_name.lower())
+    if interval is None:
+        raise Exception(f"No known interval {interval_name}")
+
+    return interval, frequency
 
+
+@lru_cache(maxsize=256)
 def parse_start_from(to_parse: str) -> StartFrom:
     """Parse a string with "from due date/completed date"."""
-    # Strip the "from", replace the space with an underscore,
-    # and uppercase. Then, return the associated enum.
-    try:
-        ret = StartFrom[to_parse[5:].replace(" ", "_").upper()]
-        return ret
-    except KeyError:
+    # Strip the "from" and look up the associated enum.
+    start_from = _START_FROMS.get(to_parse[5:].lower())
+    if start_from is None:
         raise Exception(f"No known start from {to_parse[5:]}")
-    except Exception as e:
-        raise Exception(f"Failed to parse start from string '{to_parse}', error: {e}")
+
+    return start_from
 
 
-def parse_weekdays(to_parse: str) -> List[int]:
+@lru_cache(maxsize=256)
+def parse_weekdays(to_parse: str) -> Tuple[int, ...]:
     """In addition to parsing days numerically, we also parse weekday strings:
-    - on (monday/tuesday/...)
-    - on (mon/tue/...)"""
-    try:
-        # If the string to parse starts with "on", strip that out.
-        to_parse = to_parse.replace("on ", "")
+    - (monday/tuesday/...)
+    - (mon/tue/...)
 
+    `parse_schedule_str` has already stripped the leading "on". Like the other day
+    parsers, results are cached, so they're returned as tuples."""
+    try:
         numeric_values = parse_days(to_parse)
 
         # If we got some values from `parse_days`, then we can assume they
@@ -496,25 +657,8 @@ def parse_weekdays(to_parse: str) -> List[int]:
         # Otherwise, parse weekdays. We'll do this by turning them into a
         # numeric format compatible with `parse_days()` (replacing all weekday
         # strings with numbers)
-        #
-        # There is some subtle but _VERY IMPORTANT_ behavior here. Most day abbreviations are
-        # subsets of the full day (e.g. "tue", "tuesday"). We sort the list of day names by
-        # length in reverse order to make sure that full day names are _matched first_. If we
-        # don't do this, a string like "monday/tuesday" may be turned into "0day/1day".
-        pattern = "|".join(
-            sorted(
-                (re.escape(k) for k in WEEKDAYS),
-                key=lambda s: len(s),
-                reverse=True,
-            )
-        )
-        to_parse = re.sub(
-            pattern,
-            # We have to cast to a string to make re.sub happy (it expects a function
-            # that returns a string here)
-            lambda m: str(WEEKDAYS[m.group(0).lower()]),
-            to_parse,
-            flags=re.IGNORECASE,
+        to_parse = WEEKDAY_PATTERN.sub(
+            lambda m: _WEEKDAY_NUMBERS[m.group(0).lower()], to_parse
         )
 
         return check_numerics(parse_numerics(to_parse), 1, 7)
@@ -522,67 +666,84 @@ def parse_weekdays(to_parse: str) -> List[int]:
         raise Exception(f"Failed to parse weekdays string '{to_parse}', error: {e}")
 
 
-def check_numerics(numerics: List[int], min: int, max: int) -> List[int]:
-    """Check that everything in the list is in bounds"""
-    s = sorted(numerics)
+def parse_time(to_parse: str) -> time:
+    """Parse the time of day a schedule is due at, e.g. "9am", "9:30pm" or "17:30". This
+    is all we need from a time string, so we skip the much heavier `dateutil.parser`."""
+    m = TIME_PATTERN.fullmatch(to_parse)
+    if m is None:
+        raise Exception(f"Failed to parse time string '{to_parse}'")
 
-    if s[0] < min or s[-1] > max:
+    hour = int(m.group(1))
+    minute = int(m.group(2) or 0)
+    meridiem = (m.group(3) or "").lower()
+    if meridiem == "pm" and hour != 12:
+        hour += 12
+    elif meridiem == "am" and hour == 12:
+        hour = 0
+
+    try:
+        return time(hour=hour, minute=minute)
+    except ValueError as e:
+        raise Exception(f"Failed to parse time string '{to_parse}', error: {e}")
+
+
+def check_numerics(numerics: Tuple[int, ...], lo: int, hi: int) -> Tuple[int, ...]:
+    """Check that everything in the list is between `lo` and `hi`. The list must already
+    be sorted (as `parse_numerics` returns it), so we only need to check the ends."""
+    if numerics[0] < lo or numerics[-1] > hi:
         raise Exception(
-            f"Out of bounds numbers in list {numerics}, min: {min}, max: {max}"
+            f"Out of bounds numbers in list {list(numerics)}, min: {lo}, max: {hi}"
         )
 
-    return s
+    return numerics
 
 
-def parse_days(to_parse: str) -> List[int]:
+@lru_cache(maxsize=256)
+def parse_days(to_parse: str) -> Tuple[int, ...]:
     """Takes a string detailing specific days the schedule should execute
-    on. Can be one of the following:
-    - on day (X)
-    - on day (1-n/n+1-z/X)
-    - on the last day"""
+    on, after `parse_schedule_str` has stripped the leading "on". Can be one of
+    the following:
+    - day (X)
+    - day (1-n/n+1-z/X)
+    - the last day"""
     try:
-        # If the string to parse starts with "on", strip that out.
-        to_parse = to_parse.replace("on ", "")
-
-        # If is "on the last day", just return [-1]
+        # If is "on the last day", just return (-1,)
         if to_parse == "the last day":
-            return [-1]
-
-        # Otherwise, we'll build a list of numeric values
-        numeric_values: List[int] = []
+            return (-1,)
 
         # Otherwise, if our string starts with "on day", we'll assume it's specifying numeric values
         if to_parse.startswith("day"):
-            numeric_values = parse_numerics(to_parse[4:])
+            return parse_numerics(to_parse[4:])
 
-        return numeric_values
+        return ()
     except Exception as e:
         raise Exception(f"Failed to parse days string '{to_parse}', error: {e}")
 
 
-def parse_numerics(to_parse: str) -> List[int]:
-    """Parse a string containing numeric values and return a list of integers."""
+@lru_cache(maxsize=256)
+def parse_numerics(to_parse: str) -> Tuple[int, ...]:
+    """Parse a string containing numeric values and return a sorted tuple of integers."""
     try:
-        # Split the string, and filter into ranges and values
-        parts = to_parse.split("/")
-        ranges = list(filter(lambda s: "-" in s, parts))
-
-        # Immediately add any hardcoded numbers
-        numeric_values = [int(v) for v in filter(lambda s: "-" not in s, parts)]
-
-        # Parse ranges and add them as well
-        for r in ranges:
-            i, n = [int(s) for s in r.split("-")]
-            numeric_values.extend(range(i, n + 1))
+        # Split the string, and add each range or hardcoded number as we see it
+        numeric_values: List[int] = []
+        for part in to_parse.split("/"):
+            if "-" in part:
+                i, n = part.split("-", 1)
+                numeric_values.extend(range(int(i), int(n) + 1))
+            else:
+                numeric_values.append(int(part))
 
-        return sorted(numeric_values)
+        numeric_values.sort()
+        return tuple(numeric_values)
     except Exception as e:
         raise Exception(
             f"Failed to parse numeric literal string: '{to_parse}', error: {e}"
         )
 
 
-def get_next_due_date(task: Task) -> Union[datetime, date]:
+def get_next_due_date(
+    task: Task, now: Optional[datetime] = None
+) -> Union[datetime, date]:
     """Given a task, figure out what its next due date will be based on its schedule. In its
     most basic form, a schedule will just be a Cron string. However, it may also take the following
     forms:
@@ -615,27 +776,35 @@ def get_next_due_date(task: Task) -> Union[datetime, date]:
         - "Every 1 months, on the last day"
 
     To specify days of the week, you may use either abbreviations (e.g. mon, tue) or the full day
-    name (monday, tuesday). Time (9am) must be in dateutil-compatible string format.
+    name (monday, tuesday). Time must be of the form "9am", "9:30pm", or "17:30".
 
     If "from (due date/completed date)" is not specified, we will choose a default, depending on
     the configuration. Note that you cannot specify _*both*_ "start from" _*and*_ specific days to
-    execute on."""
+    execute on.
+
+    Due dates are computed as of `now`, which defaults to the current time."""
 
     if task.schedule is None:
         raise Exception(f"Task '{task.name}' has no schedule")
 
     # Check if it's an expression that croniter can handle, or if we need to process
-    # ourselves.
-    if croniter.is_valid(task.schedule):
-        # croniter's got this
-        logger.info(
-            f"Task {task.name} has a cron-compatible schedule - deferring to croniter"
-        )
-        base = datetime.now().astimezone()
-        iter = croniter(task.schedule, base)
-        return iter.get_next(datetime)
-    else:
-        # Process with the schedule utility
-        logger.info(f"Task {task.name} has a custom schedule - parsing")
-        schedule = Schedule(task)
-        return schedule.get_next()
+    # ourselves. Our own schedules always start with "every", which is never a valid cron
+    # expression, so those skip croniter entirely. Otherwise, we just try to build the
+    # iterator rather than calling `croniter.is_valid` first, which would parse the
+    # expression a second time. `is_valid` swallows `CroniterError`, so we do the same.
+    if task.schedule[:5].lower() != "every":
+        try:
+            iter = croniter(task.schedule, now or datetime.now().astimezone())
+        except CroniterError:
+            pass
+        else:
+            # croniter's got this
+            logger.info(
+                f"Task {task.name} has a cron-compatible schedule - deferring to croniter"
+            )
+            return iter.get_next(datetime)
+
+    # Process with the schedule utility
+    logger.info(f"Task {task.name} has a custom schedule - parsing")
+    schedule = Schedule(task)
+    return schedule.get_next(now)
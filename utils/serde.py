@@ -1,14 +1,27 @@
 """Utilities for working with JSON"""
 
 from abc import ABCMeta
-from copy import copy
-from typing import Any, Callable, List, Mapping, Optional, Tuple, Type, TypeVar, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
 from uuid import UUID
 
 # from .locator import Locator
 
 D = TypeVar("D", bound="Deserializable")
 
+# A function converting a single member variable to or from JSON.
+Converter = Callable[[Any], Any]
+
 
 class Deserializable(metaclass=ABCMeta):
     """A value which can be deserialized from JSON."""
@@ -18,41 +31,24 @@ class Deserializable(metaclass=ABCMeta):
         """Parse and validate a message of this type from a JSON value.
 
         This is not expected to be particularly fast, merely convenient."""
-
-        # Make a shallow copy of our object so that we can mutate it in place
-        # without any surprises.
         if not isinstance(json, dict):
             raise Exception(f"expected dict, got JSON value {json}")
-        json = copy(json)
-        annotations = recursively_get_annotations(cls)
-        for key in json:
-            # Look up the declared type of this member variable.
-            if not key in annotations:
-                raise Exception(
-                    f"cannot deserialize {json}: {key} not declared in {cls}",
-                )
-
-            original_ty = annotations[key]
-            base_ty, args = _degenericize_type(original_ty)
-            # Convert `Optional[T]` to `T`. `Optional[T]` just becomes `Union[T, NoneType]`, so
-            # we need to undo that.
-            # See https://stackoverflow.com/q/45957615/12089 for more info.
-            if (
-                base_ty == Union
-                and args is not None
-                and len(args) == 2
-                and args[1] == None.__class__
-            ):
-                ty = args[0]
-            else:
-                ty = original_ty
-
-            json[key] = recursively_deserialize_type(ty, value=json[key])
+
+        # Every key must be a member variable declared on the class.
+        plan = _deserialization_plan(cls)
+        undeclared = json.keys() - plan.keys()
+        if undeclared:
+            raise Exception(
+                f"cannot deserialize {json}: {', '.join(sorted(undeclared))} not declared in {cls}",
+            )
+
+        # Build a fresh set of arguments rather than mutating the caller's dict.
+        kwargs = {key: plan[key](value) for key, value in json.items()}
 
         # Let `__init__` handle defaulting, assignments, etc. But we need to
         # cast it to a generic `Callable` so `mypy` doesn't complain.
         cls_untyped: Callable = cls
-        return cls_untyped(**json)
+        return cls_untyped(**kwargs)
 
 
 class Serializable(metaclass=ABCMeta):
@@ -62,113 +58,162 @@ class Serializable(metaclass=ABCMeta):
         """Serialize this type as a JSON-compatible Python structure.
 
         This is not expected to be particularly fast, merely convenient."""
-
-        # Make a shallow copy of our result to avoid modifying the underlying
-        # object.
-        result = copy(vars(self))
-
-        # Serialize any children that implement `Serializable`.
-        annotations = recursively_get_annotations(self.__class__)
-        for key in result:
-            assert key in annotations
-
-            original_ty = annotations[key]
-            base_ty, args = _degenericize_type(original_ty)
-            # Convert `Optional[T]` to `T`. `Optional[T]` just becomes `Union[T, NoneType]`, so
-            # we need to undo that.
-            # See https://stackoverflow.com/q/45957615/12089 for more info.
-            if (
-                base_ty == Union
-                and args is not None
-                and len(args) == 2
-                and args[1] == None.__class__
-            ):
-                ty = args[0]
-            else:
-                ty = original_ty
-
-            result[key] = recursively_serialize_type(ty, value=result[key])
+        # Serialize any children that implement `Serializable`, building a new
+        # dict so we don't modify the underlying object.
+        plan = _serialization_plan(self.__class__)
+        result = {}
+        for key, value in vars(self).items():
+            assert key in plan
+            result[key] = plan[key](value)
 
         return result
 
 
-def recursively_get_annotations(ty: Type) -> Mapping[str, Type]:
-    """Given a type, recursively gather annotations for its subclasses as well. We only
-    gather annotations if its subclasses are themselves subclasses of Deserializable,
-    and not Deserializable itself.
+@lru_cache(maxsize=None)
+def _deserialization_plan(cls: Type) -> Mapping[str, Converter]:
+    """Map each member variable of `cls` to the converter for its declared type.
+
+    Resolving annotations is slow, so we do it once per class rather than once
+    per call to `from_json`."""
+    return {
+        key: _deserializer_for(_unwrap_optional(ty))
+        for key, ty in recursively_get_annotations(cls).items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _serialization_plan(cls: Type) -> Mapping[str, Converter]:
+    """Map each member variable of `cls` to the converter for its declared type."""
+    return {
+        key: _serializer_for(_unwrap_optional(ty))
+        for key, ty in recursively_get_annotations(cls).items()
+    }
 
-    This is bad evil code that uses internal Python details that may break in
-    3.8 or later."""
-    # Get initial annotations
-    annotations: Mapping[str, Type] = getattr(ty, "__annotations__", {})
 
-    # Recursively gather annotations for base classes
-    for base in getattr(ty, "__bases__", {}):
-        if issubclass(base, Deserializable) and (base != Deserializable):
-            annotations = dict(annotations, **recursively_get_annotations(base))
+def _unwrap_optional(ty: Any) -> Any:
+    """Convert `Optional[T]` to `T`. `Optional[T]` just becomes `Union[T, NoneType]`, so
+    we need to undo that.
 
-    return annotations
+    See https://stackoverflow.com/q/45957615/12089 for more info."""
+    base_ty, args = _degenericize_type(ty)
+    if (
+        base_ty == Union
+        and args is not None
+        and len(args) == 2
+        and args[1] == None.__class__
+    ):
+        return args[0]
+    return ty
 
 
-def recursively_deserialize_type(ty: Type, value: Optional[Any] = None) -> Any:
+def recursively_get_annotations(ty: Type) -> Mapping[str, Type]:
+    """Given a type, gather annotations for it and all of its base classes, resolving
+    any forward references along the way.
+
+    This walks the whole MRO, so it isn't cheap; callers should cache the result per
+    class, as `_deserialization_plan` and `_serialization_plan` do."""
+    return get_type_hints(ty)
+
+
+def recursively_deserialize_type(ty: Any, value: Optional[Any] = None) -> Any:
     """Deserialize the member variable if appropriate."""
+    return _deserializer_for(ty)(value)
+
+
+def recursively_serialize_type(
+    ty: Any,
+    value: Optional[Any] = None,
+) -> Any:
+    """Serialize the member variable if possible."""
+    return _serializer_for(ty)(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _nullable(convert: Converter) -> Converter:
+    """Wrap `convert` so that `None` always converts to `None`."""
+    return lambda value: None if value is None else convert(value)
+
+
+def _unsupported(message: str) -> Converter:
+    """Build a converter for a type we can't handle. Since `None` always converts to
+    `None`, we only raise if we're actually given a value to convert."""
+
+    def convert(value: Any) -> Any:
+        raise Exception(message)
+
+    return _nullable(convert)
+
+
+@lru_cache(maxsize=1024)
+def _deserializer_for(ty: Any) -> Converter:
+    """Build a function that deserializes values of type `ty`. This is cached, so each
+    type only goes through the checks below once."""
     # If type is generic, degenericize it
     ty, args = _degenericize_type(ty)
 
-    if value is None:
-        # If value is None, we know None always deserializes to None
-        return
-    elif ty == UUID:
-        return UUID(value)
+    if ty == UUID:
+        return _nullable(UUID)
     # elif ty == Locator:
-    #     return Locator(value)
+    #     return _nullable(Locator)
     elif ty == dict:
-        if args == [str, Any]:
-            return value
+        if args == (str, Any):
+            return _identity
         else:
-            raise Exception(f"Can't deserialize dict type: {str(args)}")
+            return _unsupported(f"Can't deserialize dict type: {str(args)}")
     elif ty == list:
         if args is None or len(args) != 1:
-            raise Exception(f"Can't deserialize list, args: {str(args)}")
-        return [recursively_deserialize_type(ty=args[0], value=v) for v in value]
-    elif ty != Any and issubclass(ty, Deserializable):
-        return ty.from_json(value)
-
-    return value
-
-
-def recursively_serialize_type(
-    ty: Type,
-    value: Optional[Any] = None,
-) -> Any:
-    """Serialize the member variable if possible."""
+            return _unsupported(f"Can't deserialize list, args: {str(args)}")
+        item = _deserializer_for(args[0])
+        return _nullable(lambda value: [item(v) for v in value])
+    elif ty == Any:
+        return _identity
+    elif not isinstance(ty, type):
+        # Anything else that isn't a class (e.g. a `Union` other than `Optional`, or a
+        # `TypeVar`) is something we don't know how to convert.
+        return _unsupported(f"Can't deserialize type: {ty}, args: {str(args)}")
+    elif issubclass(ty, Deserializable):
+        return _nullable(ty.from_json)
+
+    return _identity
+
+
+@lru_cache(maxsize=1024)
+def _serializer_for(ty: Any) -> Converter:
+    """Build a function that serializes values of type `ty`."""
     # If type is generic, degenericize it
     ty, args = _degenericize_type(ty)
 
-    if value is None:
-        return
-    elif ty == UUID:
-        return str(value)
+    if ty == UUID:
+        return _nullable(str)
     # elif ty == Locator:
-    #     return str(value)
+    #     return _nullable(str)
     elif ty == dict:
-        if args == [str, Any]:
-            return value
+        if args == (str, Any):
+            return _identity
         else:
-            raise Exception(f"Unknown dict args: {str(args)}")
+            return _unsupported(f"Unknown dict args: {str(args)}")
     elif ty == list:
         if args is None or len(args) == 0:
-            raise Exception(f"List must have type")
-        return [recursively_serialize_type(ty=args[0], value=v) for v in value]
-    # Have to check this here because Any is not a class, and therefore does not have `issubclass` method. If we don't
-    # check this, we get an error: `TypeError: issubclass() arg 1 must be a class`
-    elif ty != Any and issubclass(ty, Serializable):
-        return value.to_json()
-
-    return value
-
-
-def _degenericize_type(ty: Type) -> Tuple[Any, Optional[List[Type]]]:
+            return _unsupported(f"List must have type")
+        item = _serializer_for(args[0])
+        return _nullable(lambda value: [item(v) for v in value])
+    elif ty == Any:
+        return _identity
+    # Have to check this here because `issubclass` only accepts classes. If we don't check
+    # this, we get an error: `TypeError: issubclass() arg 1 must be a class`
+    elif not isinstance(ty, type):
+        return _unsupported(f"Can't serialize type: {ty}, args: {str(args)}")
+    elif issubclass(ty, Serializable):
+        return _nullable(lambda value: value.to_json())
+
+    return _identity
+
+
+@lru_cache(maxsize=1024)
+def _degenericize_type(ty: Any) -> Tuple[Any, Optional[Tuple[Any, ...]]]:
     """Given a type, determine if it is an instantiation of a generic type, and
     if so, return the underlying type and the argument types used to instantiate
     it. Otherwise just return the input type.
@@ -176,6 +221,6 @@ def _degenericize_type(ty: Type) -> Tuple[Any, Optional[List[Type]]]:
     This is bad evil code that uses internal Python details that may break in
     3.8 or later."""
     if hasattr(ty, "__origin__") and hasattr(ty, "__args__"):
-        return (getattr(ty, "__origin__"), list(ty.__args__))
+        return (getattr(ty, "__origin__"), tuple(ty.__args__))
     else:
         return (ty, None)
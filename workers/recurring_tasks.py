@@ -5,7 +5,7 @@ import time
 import traceback
 from datetime import date, datetime
 from os import environ
-from typing import Union
+from typing import List, Optional, Union
 
 from loguru import logger
 
@@ -14,36 +14,38 @@ from notion.orm import now_utc
 from notion.timezones import Timezone
 from utils.schedule import get_next_due_date
 
+# The most tasks we'll create at once. Notion rate limits its API, so we don't want to
+# fire off a request for every task simultaneously.
+MAX_CONCURRENT_TASKS = 8
+
 
 def date_if_midnight(d: datetime) -> Union[date, datetime]:
     """If the time component of the datetime is zeroed, convert to a date."""
-    logger.info(f"Checking if datetime {d} has a time component...")
-    if d.hour == d.minute == d.second == d.microsecond == 0:
-        logger.info(f"Converting {d} to date")
+    if (d.hour, d.minute, d.second, d.microsecond) == (0, 0, 0, 0):
+        logger.debug("Converting {} to date", d)
         return date(d.year, d.month, d.day)
     return d
 
 
-async def create_new_recurring_task(client: NotionClient, task: Task):
-    """Create a new recurring task for the given task. Just to be extra safe, we check that
-    there isn't already an uncompleted task with the same name (which could happen if our
-    script gets interrupted partway through).
+async def create_new_recurring_task(
+    client: NotionClient, task: Task, now: Optional[datetime] = None
+):
+    """Create a new recurring task for the given task.
 
     For each new task we create, we'll copy everything from the old task, set the "Parent"
     to the most recently completed task (create a singly-linked list), and update the due
-    date to the next occurrence of this schedule"""
-    logger.info(f"Creating new recurring task {task.name}.")
+    date to the next occurrence of this schedule after `now` (defaults to the current
+    time)."""
+    logger.debug("Creating new recurring task {}.", task.name)
     try:
-        exists = await Task.check_open_task_exists_by_name(client, task.name)
-        if exists:
-            logger.info(f"There is an open task with name {task.name} - skipping")
-            return
-
         # Get the next due date, then make sure that we convert to EST so that Notion will display
         # correctly
-        next_due = get_next_due_date(task)
-        logger.info(
-            f"Creating new task {task.name}, with new due date {next_due} (previously {task.due_date})"
+        next_due = get_next_due_date(task, now)
+        logger.debug(
+            "Creating new task {}, with new due date {} (previously {})",
+            task.name,
+            next_due,
+            task.due_date,
         )
         task.due_date = (
             next_due.astimezone() if isinstance(next_due, datetime) else next_due
@@ -52,7 +54,10 @@ async def create_new_recurring_task(client: NotionClient, task: Task):
         await task.insert(client)
     except Exception as e:
         logger.error(
-            f"Failed to recreate task {task.name}, exception {e}, traceback: {traceback.format_exc()}"
+            "Failed to recreate task {}, exception {}, traceback: {}",
+            task.name,
+            e,
+            traceback.format_exc(),
         )
         raise
 
@@ -65,44 +70,79 @@ async def handle_recurring_tasks():
     # Get the timezone the user wants to use. There may be several entries if they've changed
     # timezones, but we're only interested in the most recent (that has a name). Timezones
     # are specified as strings, as described [here](https://docs.python.org/3/library/time.html#time.tzset)
-    timezone = await Timezone.find_newest_by_or_raise(
-        client,
-        {
-            "property": "Name",
-            "text": {
-                "is_not_empty": True,
+    #
+    # At the same time, get the last time this ran. The two lookups are independent, so we
+    # make both requests at once rather than waiting on each in turn.
+    timezone, ts = await asyncio.gather(
+        Timezone.find_newest_by_or_raise(
+            client,
+            {
+                "property": "Name",
+                "text": {
+                    "is_not_empty": True,
+                },
             },
-        },
+        ),
+        Execution.get_last_execution_time_utc(client),
     )
+    logger.info("Last executed: {}", ts)
 
     # Then, use that timezone (see docs above). Since datetime and other utilities use the
     # `time` library, this will result in us using the timezone the user has requested.
     environ["TZ"] = timezone.title
     time.tzset()
 
-    # First, get the last time this ran
-    ts = await Execution.get_last_execution_time_utc(client)
-    logger.info(f"Last executed: {ts}")
-
     # Query all tasks in our database that have been modified since that time
     tasks_to_recreate = await Task.find_completed_recurring_tasks_since(client, ts)
-    logger.info(
-        f"Found {len(tasks_to_recreate)} recurring tasks to make: {[t.name for t in tasks_to_recreate]}"
+    # Only build the list of names if we're actually going to log it.
+    logger.opt(lazy=True).info(
+        "Found {} recurring tasks to make: {}",
+        lambda: len(tasks_to_recreate),
+        lambda: [t.name for t in tasks_to_recreate],
     )
 
+    # Just to be extra safe, skip any task that already has an uncompleted task with the
+    # same name (which could happen if our script gets interrupted partway through). We
+    # look up all the open names at once rather than making a request per task, and only
+    # if there's anything to recreate, since that means paging through every open task.
+    skipped: List[str] = []
+    if tasks_to_recreate:
+        open_names = await Task.find_open_task_names(client)
+        skipped = [t.name for t in tasks_to_recreate if t.name in open_names]
+        if skipped:
+            logger.info("There are open tasks with names {} - skipping", skipped)
+        tasks_to_recreate = [t for t in tasks_to_recreate if t.name not in open_names]
+
     # Now, for each of these recurring tasks, we have to create a new task
-    # for the next time that schedule should execute (unless there's an outstanding
-    # task)
-    logger.info(f"Creating {len(tasks_to_recreate)} new recurring tasks.")
+    # for the next time that schedule should execute. All of them are scheduled as of
+    # the same moment, which we only look up once.
+    logger.info("Creating {} new recurring tasks.", len(tasks_to_recreate))
+    started = datetime.now().astimezone()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
+
+    async def create_with_limit(task: Task):
+        async with semaphore:
+            await create_new_recurring_task(client, task, started)
+
     responses = await asyncio.gather(
-        *[create_new_recurring_task(client, t) for t in tasks_to_recreate],
+        *[create_with_limit(t) for t in tasks_to_recreate],
         return_exceptions=True,
     )
 
+    # Summarize the run once, rather than logging every task at info level. Failures
+    # have already been logged individually by `create_new_recurring_task`.
+    failed = sum(isinstance(r, Exception) for r in responses)
+    logger.info(
+        "Created {} recurring tasks ({} skipped, {} failed)",
+        len(responses) - failed,
+        len(skipped),
+        failed,
+    )
+
     # Check if we encountered an error, and don't save the execution if we did. We don't
     # want to fail silently because that will insert a new "execution", and any failed
     # tasks will never update.
-    if any(isinstance(r, Exception) for r in responses):
+    if failed:
         raise Exception(f"Failed to create some or all tasks.")
 
     # Save a new execution
@@ -111,5 +151,5 @@ async def handle_recurring_tasks():
         date_created=now,
         name=f"""Execution ts: {now.astimezone().isoformat()}""",
     )
-    logger.info(f"Creating new execution record {execution.name}")
+    logger.info("Creating new execution record {}", execution.name)
     await execution.insert(client)